@@ -0,0 +1,57 @@
+"""
+Export the trained model into the versioned SavedModel layout that
+TF Serving (and Triton's TensorFlow backend) expect.
+
+Usage:
+    python export_for_serving.py
+
+Then serve it with:
+    docker run -p 8501:8501 \
+        -v $(pwd)/../models/serving:/models/potato \
+        -e MODEL_NAME=potato tensorflow/serving \
+        --enable_batching
+
+and point the Flask backend at it:
+    PLANT_API_TF_SERVING_URL=http://localhost:8501/v1/models/potato:predict
+"""
+import os
+
+import keras
+from tensorflow.keras.models import model_from_json
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.dirname(BASE_DIR)
+# Same fallback chain as app.load_plant_model: .keras (either location),
+# then legacy JSON + weights
+KERAS_PATHS = [
+    os.path.join(MODEL_DIR, "potato_disease_detection_model.keras"),
+    os.path.join(MODEL_DIR, "models", "potato_disease_detection_model.keras"),
+]
+JSON_PATH = os.path.join(MODEL_DIR, "potato_disease_detection_model.json")
+WEIGHTS_PATH = os.path.join(MODEL_DIR, "potato_disease_detection_model_weights.weights.h5")
+EXPORT_DIR = os.path.join(MODEL_DIR, "models", "serving", "1")
+
+
+def load_source_model():
+    """Load the trained model via the same fallbacks as the backend"""
+    for keras_path in KERAS_PATHS:
+        if os.path.exists(keras_path):
+            print(f"Loading {keras_path}")
+            return keras.models.load_model(keras_path, compile=False)
+    if os.path.exists(JSON_PATH) and os.path.exists(WEIGHTS_PATH):
+        print(f"Loading {JSON_PATH} + weights")
+        with open(JSON_PATH, 'r') as json_file:
+            model = model_from_json(json_file.read())
+        model.load_weights(WEIGHTS_PATH)
+        return model
+    raise FileNotFoundError(f"No model files found under {MODEL_DIR}")
+
+
+def main():
+    model = load_source_model()
+    model.export(EXPORT_DIR)
+    print(f"✓ SavedModel exported to {EXPORT_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Offline converter: quantize the Keras model to INT8 TFLite.
+
+Produces potato_disease_detection_model.tflite next to the other model
+files. The Flask backend picks it up automatically on CPU-only
+deployments (see load_tflite_interpreter in app.py). INT8 shrinks the
+weights 4x and lets XNNPACK use VNNI int8 dot products on modern CPUs.
+
+Usage:
+    python export_tflite_int8.py [calibration_images_dir]
+
+If a calibration directory is given, its images are used as the
+representative dataset for activation-range calibration; otherwise
+random uint8 images are used (fine for smoke testing, use real leaf
+images for production accuracy).
+"""
+import os
+import sys
+import glob
+
+import numpy as np
+import cv2
+import tensorflow as tf
+import keras
+from tensorflow.keras.models import model_from_json
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.dirname(BASE_DIR)
+# Same fallback chain as app.load_plant_model: .keras (either location),
+# then legacy JSON + weights
+KERAS_PATHS = [
+    os.path.join(MODEL_DIR, "potato_disease_detection_model.keras"),
+    os.path.join(MODEL_DIR, "models", "potato_disease_detection_model.keras"),
+]
+JSON_PATH = os.path.join(MODEL_DIR, "potato_disease_detection_model.json")
+WEIGHTS_PATH = os.path.join(MODEL_DIR, "potato_disease_detection_model_weights.weights.h5")
+TFLITE_PATH = os.path.join(MODEL_DIR, "potato_disease_detection_model.tflite")
+
+
+def load_source_model():
+    """Load the trained model via the same fallbacks as the backend"""
+    for keras_path in KERAS_PATHS:
+        if os.path.exists(keras_path):
+            print(f"Loading {keras_path}")
+            return keras.models.load_model(keras_path, compile=False)
+    if os.path.exists(JSON_PATH) and os.path.exists(WEIGHTS_PATH):
+        print(f"Loading {JSON_PATH} + weights")
+        with open(JSON_PATH, 'r') as json_file:
+            model = model_from_json(json_file.read())
+        model.load_weights(WEIGHTS_PATH)
+        return model
+    raise FileNotFoundError(f"No model files found under {MODEL_DIR}")
+
+
+def representative_dataset(calib_dir=None, num_samples=100):
+    """Yield float32 (1,256,256,3) samples for INT8 range calibration"""
+    if calib_dir:
+        paths = sorted(
+            glob.glob(os.path.join(calib_dir, "**", "*.*"), recursive=True)
+        )[:num_samples]
+        for path in paths:
+            image = cv2.imread(path, cv2.IMREAD_COLOR)
+            if image is None:
+                continue
+            image = cv2.resize(image, (256, 256))
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            yield [image[np.newaxis].astype(np.float32)]
+    else:
+        rng = np.random.default_rng(0)
+        for _ in range(num_samples):
+            sample = rng.integers(0, 256, (1, 256, 256, 3))
+            yield [sample.astype(np.float32)]
+
+
+def main():
+    calib_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    model = load_source_model()
+
+    # Convert from a concrete function with a dynamic batch dimension.
+    # from_keras_model would trace at the model's baked-in training batch
+    # size (32), which breaks calibration with batch-1 samples and would
+    # pin the artifact to one batch size, defeating the backend's
+    # resize_tensor_input micro-batching.
+    @tf.function(input_signature=[tf.TensorSpec((None, 256, 256, 3), tf.float32)])
+    def infer(x):
+        return model(x, training=False)
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions(
+        [infer.get_concrete_function()], model
+    )
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = lambda: representative_dataset(calib_dir)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    # Keep the uint8 image interface the Flask endpoints already produce
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+
+    tflite_model = converter.convert()
+    with open(TFLITE_PATH, 'wb') as f:
+        f.write(tflite_model)
+    print(f"✓ INT8 TFLite model written to {TFLITE_PATH} "
+          f"({len(tflite_model) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for the Plant Disease Detection API.
+
+Latency-optimized layout: a single worker owns the warm TF model and all
+physical cores (see the threading setup in app.py); gthread threads let
+many clients upload concurrently while the micro-batcher fuses their
+images into one forward pass. Use `-k gevent` instead when upload I/O
+dominates. For NUMA boxes, start under
+`numactl --cpunodebind=0 --membind=0` to keep one socket's memory local.
+"""
+bind = "0.0.0.0:5000"
+
+# One worker: multiple workers would each load the model and fight over
+# cores; concurrency comes from threads + the in-process micro-batcher
+workers = 1
+worker_class = "gthread"
+threads = 8
+
+# The model can take a while to load/convert on first boot
+timeout = 120
@@ -0,0 +1,134 @@
+"""
+Dedicated inference process for the Plant Disease Detection backend.
+
+Running the CNN inside the Flask worker thread holds the GIL during
+tensor conversions and blocks request I/O. This module moves the model
+into a child process that stays resident (GPU context/warm caches are
+initialized once) and exchanges tensors through a single preallocated
+multiprocessing.shared_memory block instead of pickling ~192KB of pixels
+over a pipe per request.
+
+Enabled from app.py with PLANT_API_INFERENCE_WORKER=1.
+"""
+import time
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+IMAGE_SHAPE = (256, 256, 3)
+IMAGE_BYTES = IMAGE_SHAPE[0] * IMAGE_SHAPE[1] * IMAGE_SHAPE[2]
+NUM_CLASSES = 3
+
+
+def worker_main(conn, shm_name, max_batch):
+    """
+    Child process entry point: load the model stack once, then serve
+    batches written into the shared-memory block. The parent sends the
+    batch size over the pipe; pixels and probabilities travel through
+    shared memory only.
+    """
+    # Importing app configures TF (oneDNN, XLA, threading) and gives us
+    # the whole run_inference dispatch (TRT / TFLite / tf.function)
+    import app as backend
+
+    backend.model = backend.load_plant_model()
+    backend.build_trt_engine()
+    backend.load_tflite_interpreter()
+    backend.build_infer_fn()
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    inputs = np.ndarray((max_batch,) + IMAGE_SHAPE, dtype=np.uint8,
+                        buffer=shm.buf)
+    outputs = np.ndarray((max_batch, NUM_CLASSES), dtype=np.float32,
+                         buffer=shm.buf, offset=max_batch * IMAGE_BYTES)
+
+    conn.send('ready' if backend.model is not None else 'failed')
+
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        try:
+            outputs[:batch] = backend.run_inference(inputs[:batch])
+            conn.send(batch)
+        except Exception as e:
+            conn.send(e)
+
+    shm.close()
+
+
+class InferenceWorkerClient:
+    """
+    Parent-side handle: writes preprocessed uint8 tensors into shared
+    memory, signals the worker, and reads probabilities back. Calls are
+    serialized with a lock (the micro-batcher in app.py is the intended
+    single caller anyway).
+    """
+    def __init__(self, max_batch=16, startup_timeout=300):
+        self.max_batch = max_batch
+        size = max_batch * IMAGE_BYTES + max_batch * NUM_CLASSES * 4
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.inputs = np.ndarray((max_batch,) + IMAGE_SHAPE, dtype=np.uint8,
+                                 buffer=self.shm.buf)
+        self.outputs = np.ndarray((max_batch, NUM_CLASSES), dtype=np.float32,
+                                  buffer=self.shm.buf,
+                                  offset=max_batch * IMAGE_BYTES)
+        self.lock = threading.Lock()
+
+        # spawn (not fork): the parent has already imported TF and forking
+        # a TF runtime is unsafe
+        ctx = mp.get_context('spawn')
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=worker_main,
+            args=(child_conn, self.shm.name, max_batch),
+            daemon=True
+        )
+        self.process.start()
+
+        # The child may take a while to load/convert the model on first
+        # boot, but a child that crashes before reporting (OOM, bad TF
+        # install) must not hang startup forever: poll the pipe and the
+        # process together so init_app's in-process fallback can trigger
+        status = None
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            if self.conn.poll(1):
+                try:
+                    status = self.conn.recv()
+                except EOFError:
+                    pass
+                break
+            if not self.process.is_alive():
+                break
+        if status != 'ready':
+            self.close()
+            if status is None:
+                status = 'worker died or timed out before reporting'
+            raise RuntimeError(f"Inference worker failed to start: {status}")
+
+    def predict(self, processed_images):
+        """Run a (B,256,256,3) uint8 batch in the worker process"""
+        batch = processed_images.shape[0]
+        if batch > self.max_batch:
+            raise ValueError(f"Batch {batch} exceeds max {self.max_batch}")
+        with self.lock:
+            self.inputs[:batch] = processed_images
+            self.conn.send(batch)
+            result = self.conn.recv()
+            if isinstance(result, Exception):
+                raise result
+            # Copy out so the caller keeps a stable view after the lock
+            return self.outputs[:batch].copy()
+
+    def close(self):
+        """Stop the worker process and release the shared-memory block"""
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=5)
+        except Exception:
+            pass
+        self.shm.close()
+        self.shm.unlink()
@@ -0,0 +1,16 @@
+"""
+WSGI entry point for production serving.
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Unlike the Werkzeug dev server started by `python app.py`, gunicorn's
+threaded workers overlap upload reading and response sending with model
+inference, and the micro-batcher in app.py fuses the concurrent requests
+into single forward passes.
+"""
+from app import app, init_app
+
+init_app()
+
+application = app
@@ -26,10 +26,9 @@ KERAS_PATH = os.path.join(BASE_DIR, "potato_disease_detection_model.keras")
 def load_plant_model():
     try:
         if os.path.exists(KERAS_PATH):
-            # compile=False to skip optimizer state compatibility noise
+            # compile=False and no compile() call: predictions don't need
+            # optimizer slots, loss/metric state, or train-step graphs
             model = tf.keras.models.load_model(KERAS_PATH, compile=False)
-            # Compile for predictions
-            model.compile(loss='sparse_categorical_crossentropy', metrics=['accuracy'])
             return model
 
         # Check if JSON architecture file exists
@@ -50,8 +49,6 @@ def load_plant_model():
             
         # Load weights into the architecture
         model.load_weights(WEIGHTS_PATH)
-        # Compile for predictions
-        model.compile(loss='sparse_categorical_crossentropy', metrics=['accuracy'])
         return model
     except Exception as e:
         st.error(f"Error loading model: {e}")
@@ -60,14 +57,36 @@ def load_plant_model():
 # Initialize model loading
 model = load_plant_model()
 
+# Wrap the forward pass in a tf.function specialized to the single-image
+# input shape. model.predict() retraces and runs a Python batching loop on
+# every call; the concrete function skips that per-click overhead.
+@st.cache_resource(show_spinner=False)
+def build_infer_fn():
+    if model is None:
+        return None
+
+    @tf.function(jit_compile=True,
+                 input_signature=[tf.TensorSpec((1, 256, 256, 3), tf.uint8)])
+    def _infer(x):
+        return model(x, training=False)
+
+    # Trace once up front so the first prediction doesn't pay
+    # tracing + XLA compilation cost
+    infer_fn = _infer.get_concrete_function()
+    infer_fn(tf.zeros((1, 256, 256, 3), tf.uint8))
+    return infer_fn
+
+infer_fn = build_infer_fn()
+
 # Debug info to confirm runtime versions
 st.caption(f"Runtime: TensorFlow {tf.__version__} | Keras {tf.keras.__version__}")
 
 # -----------------------------
 # Class names & Guidance
-# From training notebook: image_dataset_from_directory loads classes in ALPHABETICAL order
-# Classes are ordered alphabetically: ['Potato___Early_blight', 'Potato___healthy', 'Potato___Late_blight']
-# So indices are: 0=Early Blight, 1=Healthy, 2=Late Blight
+# From training notebook: image_dataset_from_directory sorts class subfolders
+# with case-SENSITIVE string ordering (uppercase before lowercase):
+# ['Potato___Early_blight', 'Potato___Late_blight', 'Potato___healthy']
+# So indices are: 0=Early Blight, 1=Late Blight, 2=Healthy
 CLASS_NAMES = ["Early Blight", "Late Blight","Healthy"]
 
 GUIDANCE = {
@@ -94,19 +113,22 @@ if submit:
 
         with st.spinner('Analyzing...'):
             # IMPORTANT: The model has Resizing & Rescaling layers built-in!
-            # We should feed the raw image (0-255) directly
-            processed_image = cv2.resize(opencv_image, (256, 256))
-            # Convert BGR to RGB (training used RGB via image_dataset_from_directory)
-            processed_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB)
-            # Feed as uint8 (0-255) - the model will rescale internally
-            processed_image = np.expand_dims(processed_image, axis=0)
+            # We should feed the raw image (0-255) directly.
+            # Write the BGR->RGB swap straight into a batch-shaped buffer so
+            # the batch dimension costs no extra pass over the pixels.
+            processed_image = np.empty((1, 256, 256, 3), dtype=np.uint8)
+            resized = cv2.resize(opencv_image, (256, 256), interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=processed_image[0])
 
             # Debug: Show image stats
             st.write(f"Image shape: {processed_image.shape}")
             st.write(f"Image dtype: {processed_image.dtype}, min: {processed_image.min()}, max: {processed_image.max()}")
 
             # Perform Prediction
-            predictions = model.predict(processed_image, verbose=0)
+            if infer_fn is not None:
+                predictions = infer_fn(tf.constant(processed_image)).numpy()
+            else:
+                predictions = model.predict(processed_image, verbose=0)
             predicted_index = np.argmax(predictions)
             disease_name = CLASS_NAMES[predicted_index]
             confidence = np.max(predictions) * 100